@@ -21,6 +21,7 @@ NON_ROOT_DEFAULT_HTTP_PORT = 8080
 application_config = config['application']
 host = application_config['host']
 port = application_config['port']
+number_threads = application_config['number_threads']
 
 ssl_certificate = application_config.get('ssl_certificate')
 if ssl_certificate:
@@ -70,7 +71,10 @@ if port < 1024:
     port = default_port
 
 # build the port command (along with the ssl certificate info if requested)
+# the application runs the transfer monitor, so there must be a single
+# worker process only; requests are served concurrently by its threads
 gunicorn_command = (f"python -m gunicorn --bind {host}:{port} --workers 1 "
+                    f"--worker-class gthread --threads {number_threads} "
                     "pantos.validatornode.application:create_application()")
 if ssl_certificate:
     gunicorn_command += (
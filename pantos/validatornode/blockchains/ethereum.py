@@ -37,7 +37,7 @@ _NON_MATCHING_FORWARDER_ERROR = \
 _SOURCE_TRANSFER_ID_ALREADY_USED_ERROR = \
     'PantosHub: source transfer ID already used'
 
-_TRANSACTION_ID_PATTERN = re.compile(r'^0x[a-fA-F0-9]{64}')
+_TRANSACTION_ID_PATTERN = re.compile(r'0x[a-fA-F0-9]{64}')
 
 _EIP712_DOMAIN_NAME = 'Pantos'
 
@@ -115,6 +115,8 @@ class EthereumClient(BlockchainClient):
         self.__private_key = self.get_utilities().decrypt_private_key(
             private_key, private_key_password)
         self.__address = self.get_utilities().get_address(self.__private_key)
+        # The decimals of a token contract never change
+        self.__token_decimals: dict[BlockchainAddress, int] = {}
 
     @classmethod
     def get_blockchain(cls) -> Blockchain:
@@ -164,8 +166,7 @@ class EthereumClient(BlockchainClient):
 
     def is_valid_transaction_id(self, transaction_id: str) -> bool:
         # Docstring inherited
-        return (re.fullmatch(_TRANSACTION_ID_PATTERN, transaction_id)
-                is not None)
+        return _TRANSACTION_ID_PATTERN.fullmatch(transaction_id) is not None
 
     def is_valid_validator_nonce(self, nonce: int) -> bool:
         # Docstring inherited
@@ -294,12 +295,16 @@ class EthereumClient(BlockchainClient):
 
     def read_token_decimals(self, token_address: BlockchainAddress) -> int:
         # Docstring inherited
+        decimals = self.__token_decimals.get(token_address)
+        if decimals is not None:
+            return decimals
         try:
             node_connections = self.__create_node_connections()
             token_contract = self._create_token_contract(
                 node_connections, token_address)
             decimals = token_contract.functions.decimals().call().get()
             assert isinstance(decimals, int)
+            self.__token_decimals[token_address] = decimals
             return decimals
         except ResultsNotMatchingError:
             raise
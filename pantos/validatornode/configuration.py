@@ -18,6 +18,9 @@ _DEFAULT_FILE_NAME: typing.Final[str] = 'validator-node-config.yml'
 config = Config(_DEFAULT_FILE_NAME)
 """Singleton object holding the configuration values."""
 
+_active_blockchains: tuple[Blockchain, ...] | None = None
+"""Active blockchains determined from the loaded configuration."""
+
 _VALIDATION_SCHEMA_BLOCKCHAIN = {
     'type': 'dict',
     'required': True,
@@ -196,6 +199,11 @@ _VALIDATION_SCHEMA = {
                 'min': 0,
                 'required': True
             },
+            'number_threads': {
+                'type': 'integer',
+                'min': 1,
+                'default': 8
+            },
             'ssl_certificate': {
                 'type': 'string',
                 'dependencies': 'ssl_private_key',
@@ -300,6 +308,24 @@ _VALIDATION_SCHEMA = {
 """Schema for validating the configuration file."""
 
 
+def get_active_blockchains() -> tuple[Blockchain, ...]:
+    """Get all blockchains that are configured to be active. The result
+    is determined only once for each loaded configuration.
+
+    Returns
+    -------
+    tuple of Blockchain
+        The active blockchains.
+
+    """
+    global _active_blockchains
+    if _active_blockchains is None:
+        _active_blockchains = tuple(
+            blockchain for blockchain in Blockchain
+            if get_blockchain_config(blockchain)['active'])
+    return _active_blockchains
+
+
 def get_blockchain_config(
         blockchain: Blockchain) -> typing.Dict[str, typing.Any]:
     """Get a blockchain-specific configuration dictionary.
@@ -365,5 +391,7 @@ def load_config(file_path: typing.Optional[str] = None,
     Config.load
 
     """
+    global _active_blockchains
     if reload or not config.is_loaded():
         config.load(_VALIDATION_SCHEMA, file_path)
+        _active_blockchains = None
@@ -10,6 +10,13 @@ from pantos.common.types import BlockchainAddress
 CrossChainTransferDict = dict[str, typing.Union[int, str]]
 """Type of a Pantos cross-chain transfer dictionary."""
 
+_BLOCKCHAINS_BY_ID: dict[int, Blockchain] = {
+    blockchain.value: blockchain
+    for blockchain in Blockchain
+}
+"""Blockchains by their IDs (avoids the enum machinery of
+Blockchain(blockchain_id) on frequently called code paths)."""
+
 
 @dataclasses.dataclass
 class CrossChainTransfer:
@@ -172,8 +179,8 @@ class CrossChainTransfer:
         assert isinstance(service_node_address, str)
         is_reversal_transfer = dict_['is_reversal_transfer']
         assert isinstance(is_reversal_transfer, bool)
-        return CrossChainTransfer(Blockchain(source_blockchain_id),
-                                  Blockchain(destination_blockchain_id),
+        return CrossChainTransfer(_get_blockchain(source_blockchain_id),
+                                  _get_blockchain(destination_blockchain_id),
                                   BlockchainAddress(source_hub_address),
                                   source_transfer_id, source_transaction_id,
                                   source_block_number, source_block_hash,
@@ -184,3 +191,11 @@ class CrossChainTransfer:
                                   amount, fee,
                                   BlockchainAddress(service_node_address),
                                   is_reversal_transfer)
+
+
+def _get_blockchain(blockchain_id: int) -> Blockchain:
+    try:
+        return _BLOCKCHAINS_BY_ID[blockchain_id]
+    except KeyError:
+        # Raises a ValueError for unknown blockchain IDs
+        return Blockchain(blockchain_id)
@@ -7,11 +7,13 @@ import logging
 import threading
 import time
 
-from pantos.common.blockchains.enums import Blockchain
-
 from pantos.validatornode.business.transfers import TransferInteractor
 from pantos.validatornode.configuration import config
-from pantos.validatornode.configuration import get_blockchain_config
+from pantos.validatornode.configuration import get_active_blockchains
+
+_RESTART_DELAY = 5
+"""Delay (in seconds) before restarting the monitor workers after an
+unexpected error."""
 
 _logger = logging.getLogger(__name__)
 
@@ -21,14 +23,21 @@ def run_monitor() -> None:
     active blockchain.
 
     """
-    threading.Thread(target=_run_monitor_workers).start()
+    threading.Thread(target=_supervise_monitor_workers, daemon=True).start()
+
+
+def _supervise_monitor_workers() -> None:
+    while True:
+        try:
+            _run_monitor_workers()
+        except Exception:
+            _logger.critical('transfer monitor crashed, restarting',
+                             exc_info=True)
+        time.sleep(_RESTART_DELAY)
 
 
 def _run_monitor_workers() -> None:
-    active_blockchains = [
-        blockchain for blockchain in Blockchain
-        if get_blockchain_config(blockchain)['active']
-    ]
+    active_blockchains = get_active_blockchains()
     interval = config['monitor']['interval']
     max_workers = max(1, config['monitor']['number_threads'] - 1)
     with concurrent.futures.ThreadPoolExecutor(
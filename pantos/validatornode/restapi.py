@@ -1,6 +1,7 @@
 """Module that implements the primary validator node's REST API.
 
 """
+import functools
 import logging
 import typing
 
@@ -26,12 +27,34 @@ from pantos.validatornode.business.base import InvalidSignerError
 from pantos.validatornode.business.base import UnknownTransferError
 from pantos.validatornode.business.signatures import SignatureInteractor
 from pantos.validatornode.business.transfers import TransferInteractor
-from pantos.validatornode.configuration import get_blockchain_config
+from pantos.validatornode.configuration import get_active_blockchains
 
 flask_app = flask.Flask(__name__)
 
 _logger = logging.getLogger(__name__)
 
+_BLOCKCHAINS_BY_ID: dict[int, Blockchain] = {
+    blockchain.value: blockchain
+    for blockchain in Blockchain
+}
+"""Blockchains by their IDs (all IDs passing the request validation are
+included)."""
+
+_TRANSACTION_ID_CACHE_SIZE = 8192
+"""Maximum number of cached valid transaction IDs."""
+
+
+@functools.lru_cache(maxsize=_TRANSACTION_ID_CACHE_SIZE)
+def _check_transaction_id(blockchain: Blockchain, transaction_id: str) -> None:
+    # Transaction IDs are only checked for their format, so the result
+    # for a given blockchain and transaction ID never changes. Invalid
+    # transaction IDs raise an exception and are therefore never cached,
+    # so arbitrary client input is not retained (valid transaction IDs
+    # have a bounded length).
+    blockchain_client = get_blockchain_client(blockchain)
+    if not blockchain_client.is_valid_transaction_id(transaction_id):
+        raise ValueError('invalid transaction ID')
+
 
 class _Schema(marshmallow.Schema):
     """Base validation schema.
@@ -39,19 +62,20 @@ class _Schema(marshmallow.Schema):
     """
     def _validate_blockchain_id(self, field_name: str,
                                 blockchain_id: int) -> None:
-        active_blockchain_ids = [
-            blockchain.value for blockchain in Blockchain
-            if get_blockchain_config(blockchain)['active']
-        ]
-        if blockchain_id not in active_blockchain_ids:
+        active_blockchains = get_active_blockchains()
+        if blockchain_id not in active_blockchains:
+            active_blockchain_ids = [
+                blockchain.value for blockchain in active_blockchains
+            ]
             raise marshmallow.ValidationError(
                 f'Blockchain ID must be one of {active_blockchain_ids}.',
                 field_name=field_name)
 
     def _validate_transaction_id(self, field_name: str, blockchain: Blockchain,
                                  transaction_id: str) -> None:
-        blockchain_client = get_blockchain_client(blockchain)
-        if not blockchain_client.is_valid_transaction_id(transaction_id):
+        try:
+            _check_transaction_id(blockchain, transaction_id)
+        except ValueError:
             raise marshmallow.ValidationError('Invalid transaction ID.',
                                               field_name=field_name)
 
@@ -74,7 +98,7 @@ class _TransferSignatureSchema(_Schema):
     @marshmallow.validates_schema(skip_on_field_errors=True)
     def __validate_schema(self, data: dict[str, typing.Any],
                           **kwargs: typing.Any) -> None:
-        source_blockchain = Blockchain(data['source_blockchain_id'])
+        source_blockchain = _BLOCKCHAINS_BY_ID[data['source_blockchain_id']]
         self._validate_transaction_id('source_transaction_id',
                                       source_blockchain,
                                       data['source_transaction_id'])
@@ -97,7 +121,7 @@ class _ValidatorNonceSchema(_Schema):
     @marshmallow.validates_schema(skip_on_field_errors=True)
     def __validate_schema(self, data: dict[str, typing.Any],
                           **kwargs: typing.Any) -> None:
-        source_blockchain = Blockchain(data['source_blockchain_id'])
+        source_blockchain = _BLOCKCHAINS_BY_ID[data['source_blockchain_id']]
         self._validate_transaction_id('source_transaction_id',
                                       source_blockchain,
                                       data['source_transaction_id'])
@@ -113,8 +137,8 @@ class _TransferSignature(flask_restful.Resource):
         _logger.info('new transfer signature request', extra=arguments)
         try:
             validated_arguments = _TransferSignatureSchema().load(arguments)
-            source_blockchain = Blockchain(
-                validated_arguments['source_blockchain_id'])
+            source_blockchain = _BLOCKCHAINS_BY_ID[
+                validated_arguments['source_blockchain_id']]
             source_transaction_id = validated_arguments[
                 'source_transaction_id']
             signature = validated_arguments['signature']
@@ -150,8 +174,8 @@ class _ValidatorNonce(flask_restful.Resource):
         _logger.info('new validator nonce request', extra=arguments)
         try:
             validated_arguments = _ValidatorNonceSchema().load(arguments)
-            source_blockchain = Blockchain(
-                validated_arguments['source_blockchain_id'])
+            source_blockchain = _BLOCKCHAINS_BY_ID[
+                validated_arguments['source_blockchain_id']]
             source_transaction_id = validated_arguments[
                 'source_transaction_id']
             validator_nonce = TransferInteractor().get_validator_nonce(
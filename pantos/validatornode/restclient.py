@@ -3,6 +3,7 @@ secondary validator node.
 
 """
 import dataclasses
+import json
 import logging
 import typing
 
@@ -131,9 +132,14 @@ class PrimaryNodeClient:
         url = (f'{self.__primary_node_url}{_VALIDATOR_NONCE_RESOURCE}?'
                f'source_blockchain_id={request.source_blockchain.value}&'
                f'source_transaction_id={request.source_transaction_id}')
-        extra_info = vars(request) | {'url': url, 'timeout': self.__timeout}
+        extra_info = {
+            'source_blockchain': request.source_blockchain,
+            'source_transaction_id': request.source_transaction_id,
+            'url': url,
+            'timeout': self.__timeout
+        }
         response = self.__send_get_request(url, extra_info)
-        extra_info |= {'status_code': response.status_code}
+        extra_info['status_code'] = response.status_code
         json_response = self.__decode_json_response(response, extra_info)
         if response.status_code != requests.codes.ok:
             response_message = self.__extract_response_message(
@@ -198,7 +204,13 @@ class PrimaryNodeClient:
 
         """
         url = (f'{self.__primary_node_url}{_TRANSFER_SIGNATURE_RESOURCE}')
-        extra_info = vars(request) | {'url': url, 'timeout': self.__timeout}
+        extra_info = {
+            'source_blockchain': request.source_blockchain,
+            'source_transaction_id': request.source_transaction_id,
+            'signature': request.signature,
+            'url': url,
+            'timeout': self.__timeout
+        }
         json_request = {
             'source_blockchain_id': request.source_blockchain.value,
             'source_transaction_id': request.source_transaction_id,
@@ -206,7 +218,7 @@ class PrimaryNodeClient:
         }
         response = self.__send_post_request(url, json_request, extra_info)
         if response.status_code != requests.codes.no_content:
-            extra_info |= {'status_code': response.status_code}
+            extra_info['status_code'] = response.status_code
             json_response = self.__decode_json_response(response, extra_info)
             response_message = self.__extract_response_message(
                 json_response, extra_info)
@@ -232,8 +244,10 @@ class PrimaryNodeClient:
     def __decode_json_response(self, response: requests.Response,
                                extra_info: dict[str, typing.Any]) -> dict:
         try:
-            json_response = response.json()
-        except requests.JSONDecodeError:
+            # Decode the raw response body directly instead of letting
+            # requests determine the text encoding first
+            json_response = json.loads(response.content)
+        except ValueError:
             raise PrimaryNodeClientError('JSON decode error', **extra_info)
         assert isinstance(json_response, dict)
         return json_response
@@ -244,13 +258,14 @@ class PrimaryNodeClient:
         response_message = json_response.get('message')
         if response_message is not None:
             assert isinstance(response_message, str)
-            extra_info |= {'response_message': response_message}
+            extra_info['response_message'] = response_message
         return response_message
 
     def __send_get_request(
             self, url: str, extra_info: dict[str,
                                              typing.Any]) -> requests.Response:
-        _logger.info('new GET request', extra=extra_info)
+        if _logger.isEnabledFor(logging.INFO):
+            _logger.info('new GET request', extra=extra_info)
         try:
             return requests.get(url, timeout=self.__timeout)
         except requests.Timeout:
@@ -261,7 +276,8 @@ class PrimaryNodeClient:
     def __send_post_request(
             self, url: str, json_request: dict[str, typing.Any],
             extra_info: dict[str, typing.Any]) -> requests.Response:
-        _logger.info('new POST request', extra=extra_info)
+        if _logger.isEnabledFor(logging.INFO):
+            _logger.info('new POST request', extra=extra_info)
         try:
             return requests.post(url, json=json_request,
                                  timeout=self.__timeout)
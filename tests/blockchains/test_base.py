@@ -1,4 +1,5 @@
-import tempfile
+import contextlib
+import types
 import unittest.mock
 import uuid
 
@@ -13,116 +14,218 @@ from pantos.validatornode.blockchains.base import BlockchainClientError
 from pantos.validatornode.blockchains.base import \
     UnresolvableTransferToSubmissionError
 
-_MOCK_CONFIG = {
-    'providers': [''],
-    'fallback_providers': [''],
-    'average_block_time': 14,
-    'confirmations': 12,
-    'chain_id': 1,
-    'private_key': tempfile.mkstemp()[1],
-    'private_key_password': 'some_password'
-}
+_BLOCKCHAIN = Blockchain.ETHEREUM
+
+_BLOCKCHAIN_CLIENT_ERROR = BlockchainClientError('')
 
 _TRANSACTION_ID = \
     '0x5792e26d11cdf54155de59de5ddcca3f9d084ce89f4b5d4f9e50ec30c726be70'
 
+_INTERNAL_TRANSACTION_ID = uuid.UUID('1a9e4d5c-07b5-4d3f-8f6e-0c2b3f6a9d71')
+
 _BLOCK_NUMBER = 8130014
 
 _DESTINATION_TRANSFER_ID = 9372
 
+_TRANSFER_TO_TRANSACTION_DATA_RESPONSE = \
+    BlockchainClient._TransferToTransactionDataResponse(
+        _BLOCK_NUMBER, destination_transfer_id=_DESTINATION_TRANSFER_ID)
+
+
+class _BlockchainClient(BlockchainClient):
+    @classmethod
+    def get_blockchain(cls):
+        return _BLOCKCHAIN
+
+    @classmethod
+    def get_error_class(cls):
+        return BlockchainClientError
+
+    def is_token_active(self, token_address):
+        raise NotImplementedError
+
+    def is_valid_recipient_address(self, recipient_address):
+        raise NotImplementedError
+
+    def is_valid_transaction_id(self, transaction_id):
+        raise NotImplementedError
+
+    def is_valid_validator_nonce(self, nonce):
+        raise NotImplementedError
+
+    def is_equal_address(self, address_one, address_two):
+        raise NotImplementedError
+
+    def read_external_token_address(self, token_address, external_blockchain):
+        raise NotImplementedError
+
+    def read_minimum_validator_node_signatures(self):
+        raise NotImplementedError
+
+    def read_outgoing_transfers_from_block(self, from_block_number):
+        raise NotImplementedError
+
+    def read_outgoing_transfers_in_transaction(self, transaction_id,
+                                               hub_address):
+        raise NotImplementedError
+
+    def read_token_decimals(self, token_address):
+        raise NotImplementedError
+
+    def read_validator_node_addresses(self):
+        raise NotImplementedError
+
+    def recover_transfer_to_signer_address(self, request):
+        raise NotImplementedError
+
+    def sign_transfer_to_message(self, request):
+        raise NotImplementedError
+
+    def start_transfer_to_submission(self, request):
+        raise NotImplementedError
+
+    def _read_transfer_to_transaction_data(self, transaction_id,
+                                           read_destination_transfer_id):
+        raise NotImplementedError
+
+
+class _MockUtilities:
+    def __init__(self):
+        self.status_response = None
+        self.status_error = None
+
+    def get_transaction_submission_status(self, internal_transaction_id):
+        assert internal_transaction_id == _INTERNAL_TRANSACTION_ID
+        if self.status_error is not None:
+            raise self.status_error
+        return self.status_response
+
+
+@pytest.fixture(scope='session')
+def mock_config(tmp_path_factory):
+    private_key_path = tmp_path_factory.mktemp('keystore') / 'private_key'
+    private_key_path.touch()
+    # Read-only since it is shared by all tests of the session
+    return types.MappingProxyType({
+        'providers': [''],
+        'fallback_providers': [''],
+        'average_block_time': 14,
+        'confirmations': 12,
+        'chain_id': 1,
+        'private_key': str(private_key_path),
+        'private_key_password': 'some_password'
+    })
+
+
+@pytest.fixture
+def mock_utilities(monkeypatch):
+    mock_utilities = _MockUtilities()
+    monkeypatch.setattr(_BlockchainClient, 'get_utilities',
+                        lambda self: mock_utilities)
+    return mock_utilities
+
 
 @pytest.fixture(scope='module')
-@unittest.mock.patch(
-    'pantos.validatornode.blockchains.base.initialize_blockchain_utilities')
-@unittest.mock.patch.object(BlockchainClient, '_get_config',
-                            return_value=_MOCK_CONFIG)
-@unittest.mock.patch.object(BlockchainClient, 'get_blockchain',
-                            return_value=Blockchain(0))
-@unittest.mock.patch.object(BlockchainClient, '__abstractmethods__', set())
-def blockchain_client(mock_get_blockchain, mock_get_config,
-                      mock_initialize_blockchain_utilities, config_dict):
-    with unittest.mock.patch('pantos.validatornode.blockchains.base.config',
-                             config_dict):
-        return BlockchainClient()
-
-
-@unittest.mock.patch(
-    'pantos.validatornode.blockchains.base.initialize_blockchain_utilities')
-@unittest.mock.patch.object(BlockchainClient, '_get_config',
-                            return_value=_MOCK_CONFIG)
-@unittest.mock.patch.object(BlockchainClient, 'get_blockchain',
-                            return_value=Blockchain(0))
-@unittest.mock.patch.object(BlockchainClient, '__abstractmethods__', set())
-def test_init_correct(mock_get_blockchain, mock_get_config,
-                      mock_initialize_blockchain_utilities, config_dict):
-    with unittest.mock.patch('pantos.validatornode.blockchains.base.config',
-                             config_dict):
-        BlockchainClient()
-    mock_initialize_blockchain_utilities.assert_called_once()
-
-
-@unittest.mock.patch(
-    'pantos.validatornode.blockchains.base.initialize_blockchain_utilities',
-    side_effect=BlockchainUtilitiesError(''))
+def shared_mock_read_transfer_to_transaction_data():
+    with unittest.mock.patch.object(
+            _BlockchainClient, '_read_transfer_to_transaction_data') as \
+            mock_read_transfer_to_transaction_data:
+        yield mock_read_transfer_to_transaction_data
+
+
+@pytest.fixture
+def mock_read_transfer_to_transaction_data(
+        shared_mock_read_transfer_to_transaction_data):
+    # Only the call history of the shared mock must not leak between tests
+    shared_mock_read_transfer_to_transaction_data.reset_mock()
+    return shared_mock_read_transfer_to_transaction_data
+
+
+@contextlib.contextmanager
+def _patched_blockchain_client(mock_config):
+    # Plain attribute assignments (restored on exit) avoid the overhead
+    # of stacked mock patches for attributes that are never asserted on
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(_BlockchainClient, '_get_config',
+                            lambda self: mock_config)
+        yield
+
+
+def _patched_base_module(config_dict):
+    # Single patcher for all module attributes used during initialization
+    return unittest.mock.patch.multiple(
+        'pantos.validatornode.blockchains.base', config=config_dict,
+        initialize_blockchain_utilities=unittest.mock.DEFAULT)
+
+
+@pytest.fixture(scope='session')
+def blockchain_client():
+    # The initialization is only tested by the dedicated init tests
+    return _BlockchainClient.__new__(_BlockchainClient)
+
+
+def test_init_correct(mock_config, config_dict):
+    with _patched_blockchain_client(mock_config):
+        with _patched_base_module(config_dict) as mocks:
+            _BlockchainClient()
+    mocks['initialize_blockchain_utilities'].assert_called_once()
+
+
 @unittest.mock.patch.object(BlockchainClient, '_create_error',
-                            return_value=BlockchainClientError(''))
-@unittest.mock.patch.object(BlockchainClient, '_get_config',
-                            return_value=_MOCK_CONFIG)
-@unittest.mock.patch.object(BlockchainClient, 'get_blockchain',
-                            return_value=Blockchain(0))
-@unittest.mock.patch.object(BlockchainClient, '__abstractmethods__', set())
-def test_init_error(mock_get_blockchain, mock_get_config, mock_create_error,
-                    mock_initialize_blockchain_utilities, config_dict):
+                            return_value=_BLOCKCHAIN_CLIENT_ERROR)
+def test_init_error(mock_create_error, mock_config, config_dict):
     with pytest.raises(BlockchainClientError) as exception_info:
-        with unittest.mock.patch(
-                'pantos.validatornode.blockchains.base.config', config_dict):
-            BlockchainClient()
+        with _patched_blockchain_client(mock_config):
+            with _patched_base_module(config_dict) as mocks:
+                mocks['initialize_blockchain_utilities'].side_effect = \
+                    BlockchainUtilitiesError('')
+                _BlockchainClient()
     assert isinstance(exception_info.value.__context__,
                       BlockchainUtilitiesError)
 
 
-@unittest.mock.patch.object(BlockchainClient, 'get_utilities')
-def test_get_transfer_to_submission_status_not_completed(
-        mock_get_utilities, blockchain_client):
-    mock_get_utilities().get_transaction_submission_status.return_value = \
-        BlockchainUtilities.TransactionSubmissionStatusResponse(False)
+@pytest.mark.parametrize(
+    'utilities_status_response, transaction_data_response, '
+    'read_transaction_data_calls, expected_status_response', [
+        pytest.param(
+            BlockchainUtilities.TransactionSubmissionStatusResponse(False),
+            None, [],
+            BlockchainClient.TransferToSubmissionStatusResponse(False),
+            id='not-completed'),
+        pytest.param(
+            BlockchainUtilities.TransactionSubmissionStatusResponse(
+                True, TransactionStatus.CONFIRMED,
+                _TRANSACTION_ID), _TRANSFER_TO_TRANSACTION_DATA_RESPONSE,
+            [unittest.mock.call(_TRANSACTION_ID, True)],
+            BlockchainClient.TransferToSubmissionStatusResponse(
+                True, TransactionStatus.CONFIRMED, _TRANSACTION_ID,
+                _BLOCK_NUMBER, _DESTINATION_TRANSFER_ID), id='confirmed'),
+        pytest.param(
+            BlockchainUtilities.TransactionSubmissionStatusResponse(
+                True, TransactionStatus.REVERTED, _TRANSACTION_ID),
+            BlockchainClient._TransferToTransactionDataResponse(_BLOCK_NUMBER),
+            [unittest.mock.call(_TRANSACTION_ID, False)],
+            BlockchainClient.TransferToSubmissionStatusResponse(
+                True, TransactionStatus.REVERTED, _TRANSACTION_ID,
+                _BLOCK_NUMBER, None), id='reverted')
+    ])
+def test_get_transfer_to_submission_status_correct(
+        utilities_status_response, transaction_data_response,
+        read_transaction_data_calls, expected_status_response, mock_utilities,
+        mock_read_transfer_to_transaction_data, blockchain_client):
+    mock_utilities.status_response = utilities_status_response
+    mock_read_transfer_to_transaction_data.return_value = \
+        transaction_data_response
     status_response = blockchain_client.get_transfer_to_submission_status(
-        uuid.uuid4())
-    assert not status_response.transaction_submission_completed
+        _INTERNAL_TRANSACTION_ID)
+    assert status_response == expected_status_response
+    assert (mock_read_transfer_to_transaction_data.call_args_list ==
+            read_transaction_data_calls)
 
 
-@pytest.mark.parametrize(
-    'transaction_status',
-    [TransactionStatus.CONFIRMED, TransactionStatus.REVERTED])
-@unittest.mock.patch.object(
-    BlockchainClient, '_read_transfer_to_transaction_data',
-    return_value=BlockchainClient._TransferToTransactionDataResponse(
-        _BLOCK_NUMBER, destination_transfer_id=_DESTINATION_TRANSFER_ID))
-@unittest.mock.patch.object(BlockchainClient, 'get_utilities')
-def test_get_transfer_to_submission_status_completed(
-        mock_get_utilities, mock_read_transfer_to_transaction_data,
-        transaction_status, blockchain_client):
-    mock_get_utilities().get_transaction_submission_status.return_value = \
-        BlockchainUtilities.TransactionSubmissionStatusResponse(
-            True, transaction_status, _TRANSACTION_ID)
-    status_response = blockchain_client.get_transfer_to_submission_status(
-        uuid.uuid4())
-    assert status_response.transaction_submission_completed
-    assert status_response.transaction_status is transaction_status
-    assert status_response.transaction_id == _TRANSACTION_ID
-    assert status_response.block_number == _BLOCK_NUMBER
-    if transaction_status is TransactionStatus.CONFIRMED:
-        assert (status_response.destination_transfer_id ==
-                _DESTINATION_TRANSFER_ID)
-
-
-@unittest.mock.patch.object(BlockchainClient, 'get_utilities')
-@unittest.mock.patch.object(BlockchainClient, 'get_error_class',
-                            return_value=BlockchainClientError)
-def test_get_transfer_to_submission_status_error(mock_get_error_class,
-                                                 mock_get_utilities,
+def test_get_transfer_to_submission_status_error(mock_utilities,
                                                  blockchain_client):
-    mock_get_utilities().get_transaction_submission_status.side_effect = \
-        BlockchainUtilitiesError('')
+    mock_utilities.status_error = BlockchainUtilitiesError('')
     with pytest.raises(UnresolvableTransferToSubmissionError):
-        blockchain_client.get_transfer_to_submission_status(uuid.uuid4())
+        blockchain_client.get_transfer_to_submission_status(
+            _INTERNAL_TRANSACTION_ID)
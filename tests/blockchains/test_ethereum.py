@@ -1,6 +1,4 @@
-import atexit
-import pathlib
-import tempfile
+import functools
 import unittest.mock
 import uuid
 
@@ -38,11 +36,15 @@ _DESTINATION_BLOCK_NUMBER = 20842624
 _DESTINATION_TRANSACTION_HASH = hexbytes.HexBytes(
     '0x5792e26d11cdf54155de59de5ddcca3f9d084ce89f4b5d4f9e50ec30c726be70')
 
+_DESTINATION_TRANSACTION_HASH_STR = _DESTINATION_TRANSACTION_HASH.to_0x_hex()
+
 _SOURCE_BLOCK_NUMBER = 51065469
 
 _SOURCE_TRANSACTION_HASH = hexbytes.HexBytes(
     '0x79a6ae275eae47bbb9c63dcf18e5d14a647d4d39a3463f06d25a581853d8bdc3')
 
+_SOURCE_TRANSACTION_HASH_STR = _SOURCE_TRANSACTION_HASH.to_0x_hex()
+
 _INCOMING_TRANSFER = CrossChainTransfer(
     source_blockchain=Blockchain.SONIC,
     destination_blockchain=Blockchain.ETHEREUM,
@@ -63,14 +65,19 @@ _INCOMING_TRANSFER = CrossChainTransfer(
     fee=50000000, service_node_address=BlockchainAddress(
         '0x726265A9e352F2e9f15F255957840992803cED7d'))
 
-_OUTGOING_TRANSFER_LOGS = [
+# Block including two of the outgoing test transfers
+_OUTGOING_TRANSFERS_BLOCK_HASH = hexbytes.HexBytes(
+    '0x95f48bfd5f6b71da3f321c063ba0d4c700781d1ddc4cb92fe6dcefc0b88edfe8')
+
+_OUTGOING_TRANSFERS_BLOCK_HASH_STR = _OUTGOING_TRANSFERS_BLOCK_HASH.to_0x_hex()
+
+_TRANSFER_FROM_SUCCEEDED_EVENT_TOPIC = hexbytes.HexBytes(
+    '0xe2d69d9df6c1e740c72aecc4a0cd85eca27cbc5273ec079de974008f492a9f8b')
+
+_OUTGOING_TRANSFER_LOGS = (
     web3.datastructures.AttributeDict({
         'address': '0x0F911887da88500a364Fa925f72A8F24709EE3aC',
-        'topics': [
-            hexbytes.HexBytes(
-                '0xe2d69d9df6c1e740c72aecc4a0cd85eca27cbc5273ec079de974008f492'
-                'a9f8b')
-        ],
+        'topics': [_TRANSFER_FROM_SUCCEEDED_EVENT_TOPIC],
         'data': hexbytes.HexBytes(
             '0x000000000000000000000000000000000000000000000000000000000000000'
             '40000000000000000000000000000000000000000000000000000000000000001'
@@ -100,11 +107,7 @@ _OUTGOING_TRANSFER_LOGS = [
     }),
     web3.datastructures.AttributeDict({
         'address': '0x0F911887da88500a364Fa925f72A8F24709EE3aC',
-        'topics': [
-            hexbytes.HexBytes(
-                '0xe2d69d9df6c1e740c72aecc4a0cd85eca27cbc5273ec079de974008f492'
-                'a9f8b')
-        ],
+        'topics': [_TRANSFER_FROM_SUCCEEDED_EVENT_TOPIC],
         'data': hexbytes.HexBytes(
             '0x000000000000000000000000000000000000000000000000000000000000000'
             '30000000000000000000000000000000000000000000000000000000000000003'
@@ -126,19 +129,13 @@ _OUTGOING_TRANSFER_LOGS = [
             '0x7db79ac657e81d2a255cd39013a709b2710be4b1a0d5bc1967be6c10c0feb93'
             '7'),
         'transactionIndex': 2,
-        'blockHash': hexbytes.HexBytes(
-            '0x95f48bfd5f6b71da3f321c063ba0d4c700781d1ddc4cb92fe6dcefc0b88edfe'
-            '8'),
+        'blockHash': _OUTGOING_TRANSFERS_BLOCK_HASH,
         'logIndex': 5,
         'removed': False
     }),
     web3.datastructures.AttributeDict({
         'address': '0x0F911887da88500a364Fa925f72A8F24709EE3aC',
-        'topics': [
-            hexbytes.HexBytes(
-                '0xe2d69d9df6c1e740c72aecc4a0cd85eca27cbc5273ec079de974008f492'
-                'a9f8b')
-        ],
+        'topics': [_TRANSFER_FROM_SUCCEEDED_EVENT_TOPIC],
         'data': hexbytes.HexBytes(
             '0x000000000000000000000000000000000000000000000000000000000000000'
             '20000000000000000000000000000000000000000000000000000000000000005'
@@ -160,80 +157,82 @@ _OUTGOING_TRANSFER_LOGS = [
             '0x42e8586384d49e9c67eb2b7dae4668dd430e1d29792106ae04e60cf7048a4f3'
             '5'),
         'transactionIndex': 1,
-        'blockHash': hexbytes.HexBytes(
-            '0x95f48bfd5f6b71da3f321c063ba0d4c700781d1ddc4cb92fe6dcefc0b88edfe'
-            '8'),
+        'blockHash': _OUTGOING_TRANSFERS_BLOCK_HASH,
         'logIndex': 2,
         'removed': False
-    })
-]
+    }))
+
+_OUTGOING_TRANSFERS_HUB_ADDRESS = BlockchainAddress(
+    '0x0F911887da88500a364Fa925f72A8F24709EE3aC')
+
+_OUTGOING_TRANSFERS_SENDER_ADDRESS = BlockchainAddress(
+    '0x96f4B54091f223e1343352AE932fF385f025E301')
+
+_OUTGOING_TRANSFERS_SOURCE_TOKEN_ADDRESS = BlockchainAddress(
+    '0x7eade9AE29C756d77a370353dC2eF5482d6b5219')
+
+_OUTGOING_TRANSFERS_SERVICE_NODE_ADDRESS = BlockchainAddress(
+    '0xaAE34Ec313A97265635B8496468928549cdd4AB7')
 
 _OUTGOING_TRANSFERS = [
     CrossChainTransfer(
         source_blockchain=Blockchain.ETHEREUM,
         destination_blockchain=Blockchain.BNB_CHAIN,
-        source_hub_address=BlockchainAddress(
-            '0x0F911887da88500a364Fa925f72A8F24709EE3aC'),
+        source_hub_address=_OUTGOING_TRANSFERS_HUB_ADDRESS,
         source_transfer_id=4,
-        source_transaction_id=_SOURCE_TRANSACTION_HASH.to_0x_hex(),
+        source_transaction_id=_SOURCE_TRANSACTION_HASH_STR,
         source_block_number=_SOURCE_BLOCK_NUMBER,
         source_block_hash='0x29b78d019efc8a3edb4043426deef8c837aac793d7cc2f10f'
-        '288df57c1e6b298', sender_address=BlockchainAddress(
-            '0x96f4B54091f223e1343352AE932fF385f025E301'),
+        '288df57c1e6b298', sender_address=_OUTGOING_TRANSFERS_SENDER_ADDRESS,
         recipient_address=BlockchainAddress(
             '0xA769400e4e5d7E37ae1BA0C0EfCFa0CFD5c165b4'),
-        source_token_address=BlockchainAddress(
-            '0x7eade9AE29C756d77a370353dC2eF5482d6b5219'),
+        source_token_address=_OUTGOING_TRANSFERS_SOURCE_TOKEN_ADDRESS,
         destination_token_address=BlockchainAddress(
             '0x8c24D9bEa5b192009FB07861a7Fc23Ea9fE223ec'), amount=310000000,
-        fee=8500000000, service_node_address=BlockchainAddress(
-            '0xaAE34Ec313A97265635B8496468928549cdd4AB7'),
+        fee=8500000000,
+        service_node_address=_OUTGOING_TRANSFERS_SERVICE_NODE_ADDRESS,
         is_reversal_transfer=False),
     CrossChainTransfer(
         source_blockchain=Blockchain.ETHEREUM,
         destination_blockchain=Blockchain.AVALANCHE,
-        source_hub_address=BlockchainAddress(
-            '0x0F911887da88500a364Fa925f72A8F24709EE3aC'),
+        source_hub_address=_OUTGOING_TRANSFERS_HUB_ADDRESS,
         source_transfer_id=3,
         source_transaction_id='0x7db79ac657e81d2a255cd39013a709b2710be4b1a0d5b'
         'c1967be6c10c0feb937', source_block_number=9480697,
-        source_block_hash='0x95f48bfd5f6b71da3f321c063ba0d4c700781d1ddc4cb92fe'
-        '6dcefc0b88edfe8', sender_address=BlockchainAddress(
-            '0x96f4B54091f223e1343352AE932fF385f025E301'),
+        source_block_hash=_OUTGOING_TRANSFERS_BLOCK_HASH_STR,
+        sender_address=_OUTGOING_TRANSFERS_SENDER_ADDRESS,
         recipient_address=BlockchainAddress(
             '0xaAE34Ec313A97265635B8496468928549cdd4AB7'),
-        source_token_address=BlockchainAddress(
-            '0x7eade9AE29C756d77a370353dC2eF5482d6b5219'),
+        source_token_address=_OUTGOING_TRANSFERS_SOURCE_TOKEN_ADDRESS,
         destination_token_address=BlockchainAddress(
             '0xC7895784ca04a41915D916046e304E25c26686dd'), amount=183000000,
-        fee=8500000000, service_node_address=BlockchainAddress(
-            '0xaAE34Ec313A97265635B8496468928549cdd4AB7'),
+        fee=8500000000,
+        service_node_address=_OUTGOING_TRANSFERS_SERVICE_NODE_ADDRESS,
         is_reversal_transfer=False),
     CrossChainTransfer(
         source_blockchain=Blockchain.ETHEREUM,
         destination_blockchain=Blockchain.POLYGON,
-        source_hub_address=BlockchainAddress(
-            '0x0F911887da88500a364Fa925f72A8F24709EE3aC'),
+        source_hub_address=_OUTGOING_TRANSFERS_HUB_ADDRESS,
         source_transfer_id=2,
         source_transaction_id='0x42e8586384d49e9c67eb2b7dae4668dd430e1d2979210'
         '6ae04e60cf7048a4f35', source_block_number=9480697,
-        source_block_hash='0x95f48bfd5f6b71da3f321c063ba0d4c700781d1ddc4cb92fe'
-        '6dcefc0b88edfe8', sender_address=BlockchainAddress(
-            '0x96f4B54091f223e1343352AE932fF385f025E301'),
+        source_block_hash=_OUTGOING_TRANSFERS_BLOCK_HASH_STR,
+        sender_address=_OUTGOING_TRANSFERS_SENDER_ADDRESS,
         recipient_address=BlockchainAddress(
             '0xaAE34Ec313A97265635B8496468928549cdd4AB7'),
-        source_token_address=BlockchainAddress(
-            '0x7eade9AE29C756d77a370353dC2eF5482d6b5219'),
+        source_token_address=_OUTGOING_TRANSFERS_SOURCE_TOKEN_ADDRESS,
         destination_token_address=BlockchainAddress(
             '0x6D7fC85671DE9Ab7cf442669601021fCE732F49d'), amount=590000000,
-        fee=8500000000, service_node_address=BlockchainAddress(
-            '0xaAE34Ec313A97265635B8496468928549cdd4AB7'),
+        fee=8500000000,
+        service_node_address=_OUTGOING_TRANSFERS_SERVICE_NODE_ADDRESS,
         is_reversal_transfer=False)
 ]
 
 _PRIVATE_KEY = \
     'edfb7c4593d4cc9f8a28768662a848ea1ef92bb2926ed6740a6f554e06a6e045'
 
+_OWN_ADDRESS = web3.Account.from_key(_PRIVATE_KEY).address
+
 _KEYSTORE = (
     '{"address":"ce3bbb8b5f7e568acff039369ee01c2c17585b00","crypto":{"cipher":'
     '"aes-128-ctr","ciphertext":"a80a2d44d92ac4067b77c4437d1d2dd580a6de21a64a6'
@@ -245,6 +244,10 @@ _KEYSTORE = (
 
 _KEYSTORE_PASSWORD = '0@/V4\\Uxz%OW'
 
+# The scrypt key derivation of the keystore decryption is expensive, so
+# the keystore is decrypted only once per test session
+_decrypt_keystore = functools.lru_cache(maxsize=None)(web3.Account.decrypt)
+
 _TOKEN_ADDRESS = '0x5Acfa9f0CEADd177825c67226B4Eb4f09293b756'
 
 _VALIDATOR_NONCE = 51187229043241446622
@@ -292,8 +295,8 @@ def destination_transaction_hash():
 
 
 @pytest.fixture(scope='module')
-def destination_transaction_hash_str(destination_transaction_hash):
-    return destination_transaction_hash.to_0x_hex()
+def destination_transaction_hash_str():
+    return _DESTINATION_TRANSACTION_HASH_STR
 
 
 @pytest.fixture(scope='module')
@@ -316,8 +319,8 @@ def source_transaction_hash():
 
 
 @pytest.fixture(scope='module')
-def source_transaction_hash_str(source_transaction_hash):
-    return source_transaction_hash.to_0x_hex()
+def source_transaction_hash_str():
+    return _SOURCE_TRANSACTION_HASH_STR
 
 
 @pytest.fixture(scope='module')
@@ -391,11 +394,9 @@ def incoming_transfer_message_data():
 
 
 @pytest.fixture(scope='module')
-def keystore_file_path():
-    keystore_file_path = pathlib.Path(tempfile.mkstemp()[1])
-    with keystore_file_path.open('w') as keystore_file:
-        keystore_file.write(_KEYSTORE)
-    atexit.register(keystore_file_path.unlink)
+def keystore_file_path(tmp_path_factory):
+    keystore_file_path = tmp_path_factory.mktemp('keystore') / 'keystore'
+    keystore_file_path.write_text(_KEYSTORE)
     return keystore_file_path
 
 
@@ -433,7 +434,8 @@ def ethereum_client(mock_get_config, config_dict, chain_id, keystore_file_path,
     mock_create_node_connections.return_value = node_connections
     with unittest.mock.patch('pantos.validatornode.blockchains.base.config',
                              config_dict):
-        ethereum_client = EthereumClient()
+        with unittest.mock.patch('web3.Account.decrypt', _decrypt_keystore):
+            ethereum_client = EthereumClient()
     assert ethereum_client.get_utilities()._default_private_key == _PRIVATE_KEY
     ethereum_client._EthereumClient__create_node_connections = \
         mock_create_node_connections
@@ -442,6 +444,14 @@ def ethereum_client(mock_get_config, config_dict, chain_id, keystore_file_path,
     return ethereum_client
 
 
+@pytest.fixture(autouse=True)
+def reset_ethereum_client(ethereum_client):
+    # The Ethereum client (including its mocks and caches) is shared by
+    # all tests
+    ethereum_client._EthereumClient__create_node_connections.reset_mock()
+    ethereum_client._EthereumClient__token_decimals.clear()
+
+
 @unittest.mock.patch.object(EthereumClient, 'get_utilities')
 @unittest.mock.patch.object(EthereumClient, '_get_config',
                             return_value={'provider_timeout': None})
@@ -464,26 +474,26 @@ def test_get_error_class_correct(ethereum_client):
     assert EthereumClient.get_error_class() is EthereumClientError
 
 
+# The providers are only created when the test is run
 @pytest.mark.parametrize(
-    'provider', [(web3.Web3.IPCProvider('/ipc/path'),
-                  web3.Web3.WebsocketProvider('ws://127.0.0.1'), ''),
-                 (web3.Web3.HTTPProvider('https://127.0.0.1/resource'),
-                  web3.Web3.HTTPProvider('https://127.0.0.2/resource'),
-                  '127.0.0.1, 127.0.0.2')])
-def test_get_blockchain_node_domain_correct(provider, ethereum_client):
-    w3_1 = web3.Web3(provider[0])
-    w3_2 = web3.Web3(provider[1])
+    'providers, domains',
+    [(((web3.Web3.IPCProvider, '/ipc/path'),
+       (web3.Web3.WebsocketProvider, 'ws://127.0.0.1')), ''),
+     (((web3.Web3.HTTPProvider, 'https://127.0.0.1/resource'),
+       (web3.Web3.HTTPProvider, 'https://127.0.0.2/resource')),
+      '127.0.0.1, 127.0.0.2')])
+def test_get_blockchain_node_domain_correct(providers, domains,
+                                            ethereum_client):
     node_connections = NodeConnections[web3.Web3]()
-    node_connections.add_node_connection(w3_1)
-    node_connections.add_node_connection(w3_2)
-    domains = ethereum_client._EthereumClient__get_blockchain_nodes_domains(
-        node_connections)
-    assert domains == provider[2]
+    for provider_class, provider_uri in providers:
+        node_connections.add_node_connection(
+            web3.Web3(provider_class(provider_uri)))
+    assert ethereum_client._EthereumClient__get_blockchain_nodes_domains(
+        node_connections) == domains
 
 
 def test_get_own_address_correct(ethereum_client):
-    assert (ethereum_client.get_own_address() == web3.Account.from_key(
-        _PRIVATE_KEY).address)
+    assert ethereum_client.get_own_address() == _OWN_ADDRESS
 
 
 @pytest.mark.parametrize('token_active', [True, False])
@@ -670,11 +680,12 @@ def test_read_outgoing_transfers_from_block_correct(mock_get_config,
             and log.blockNumber <= filter_params['toBlock']  # type: ignore
         ]
 
-    with unittest.mock.patch.object(w3.eth, 'get_logs', mock_get_logs):
-        with unittest.mock.patch.object(w3.eth, 'get_block_number',
-                                        return_value=latest_block_number):
-            response = ethereum_client.read_outgoing_transfers_from_block(
-                from_block_number)
+    with unittest.mock.patch.multiple(
+            w3.eth, get_logs=mock_get_logs,
+            get_block_number=unittest.mock.MagicMock(
+                return_value=latest_block_number)):
+        response = ethereum_client.read_outgoing_transfers_from_block(
+            from_block_number)
     assert (response.outgoing_transfers == [
         transfer for transfer in _OUTGOING_TRANSFERS
         if transfer.source_block_number >= from_block_number
@@ -754,6 +765,17 @@ def test_read_token_decimals_correct(mock_create_token_contract,
         ethereum_client.read_token_decimals(_TOKEN_ADDRESS) == token_decimals)
 
 
+@unittest.mock.patch.object(EthereumClient, '_create_token_contract')
+def test_read_token_decimals_cached(mock_create_token_contract,
+                                    ethereum_client):
+    mock_create_token_contract().functions.decimals().call().get.\
+        return_value = 18
+    mock_create_token_contract.reset_mock()
+    assert ethereum_client.read_token_decimals(_TOKEN_ADDRESS) == 18
+    assert ethereum_client.read_token_decimals(_TOKEN_ADDRESS) == 18
+    mock_create_token_contract.assert_called_once()
+
+
 def test_read_token_decimals_error(ethereum_client):
     with pytest.raises(EthereumClientError) as exception_info:
         ethereum_client.read_token_decimals(_TOKEN_ADDRESS)
@@ -862,8 +884,7 @@ def test_recover_transfer_to_signer_address_correct(
     recovered_signer_address = \
         ethereum_client.recover_transfer_to_signer_address(request)
 
-    expected_signer_address = web3.Account.from_key(_PRIVATE_KEY).address
-    assert recovered_signer_address == expected_signer_address
+    assert recovered_signer_address == _OWN_ADDRESS
 
 
 @unittest.mock.patch.object(EthereumClient, '_get_config')
@@ -912,7 +933,7 @@ def test_sign_transfer_to_message_correct(mock_get_config, eip712_domain_data,
         incoming_transfer_message_data)
     signer_address = eth_account.account.Account.recover_message(
         signable_message, signature=signature)
-    assert signer_address == web3.Account.from_key(_PRIVATE_KEY).address
+    assert signer_address == _OWN_ADDRESS
 
 
 def test_sign_transfer_to_message_destination_blockchain_error(
@@ -1,6 +1,7 @@
 import pytest
 from pantos.common.blockchains.enums import Blockchain
 
+from pantos.validatornode.restapi import _check_transaction_id
 from pantos.validatornode.restapi import flask_app
 
 _SOURCE_BLOCKCHAIN = Blockchain.AVALANCHE
@@ -30,3 +31,8 @@ def source_transaction_id():
 @pytest.fixture
 def validator_nonce():
     return _VALIDATOR_NONCE
+
+
+@pytest.fixture(autouse=True)
+def clear_transaction_id_cache():
+    _check_transaction_id.cache_clear()
@@ -35,9 +35,9 @@ def transfer_signature_request(source_blockchain, source_transaction_id,
     'ignore:The \'__version__\' attribute is deprecated')
 @unittest.mock.patch('pantos.validatornode.restapi.SignatureInteractor')
 @unittest.mock.patch('pantos.validatornode.restapi.get_blockchain_client')
-@unittest.mock.patch('pantos.validatornode.restapi.get_blockchain_config',
-                     return_value={'active': True})
-def test_transfer_signature_correct(mock_get_blockchain_config,
+@unittest.mock.patch('pantos.validatornode.restapi.get_active_blockchains',
+                     return_value=tuple(Blockchain))
+def test_transfer_signature_correct(mock_get_active_blockchains,
                                     mock_get_blockchain_client,
                                     mock_signature_interactor,
                                     transfer_signature_request, test_client):
@@ -60,10 +60,10 @@ def test_transfer_signature_correct(mock_get_blockchain_config,
     [None, 'some_string', Blockchain.ETHEREUM.value,
      max(Blockchain) + 1])
 @unittest.mock.patch('pantos.validatornode.restapi.get_blockchain_client')
-@unittest.mock.patch('pantos.validatornode.restapi.get_blockchain_config',
-                     return_value={'active': True})
+@unittest.mock.patch('pantos.validatornode.restapi.get_active_blockchains',
+                     return_value=tuple(Blockchain))
 def test_transfer_signature_bad_request_schema_error(
-        mock_get_blockchain_config, mock_get_blockchain_client,
+        mock_get_active_blockchains, mock_get_blockchain_client,
         source_blockchain_id, source_transaction_id,
         transfer_signature_request, test_client):
     mock_get_blockchain_client().is_valid_transaction_id.return_value = False
@@ -90,10 +90,10 @@ def test_transfer_signature_bad_request_schema_error(
     'ignore:The \'__version__\' attribute is deprecated')
 @unittest.mock.patch('pantos.validatornode.restapi.SignatureInteractor')
 @unittest.mock.patch('pantos.validatornode.restapi.get_blockchain_client')
-@unittest.mock.patch('pantos.validatornode.restapi.get_blockchain_config',
-                     return_value={'active': True})
+@unittest.mock.patch('pantos.validatornode.restapi.get_active_blockchains',
+                     return_value=tuple(Blockchain))
 def test_transfer_signature_bad_request_signature_error(
-        mock_get_blockchain_config, mock_get_blockchain_client,
+        mock_get_active_blockchains, mock_get_blockchain_client,
         mock_signature_interactor, transfer_signature_request, test_client):
     mock_get_blockchain_client().is_valid_transaction_id.return_value = True
     mock_signature_interactor().add_secondary_node_signature.side_effect = \
@@ -110,10 +110,10 @@ def test_transfer_signature_bad_request_signature_error(
     'ignore:The \'__version__\' attribute is deprecated')
 @unittest.mock.patch('pantos.validatornode.restapi.SignatureInteractor')
 @unittest.mock.patch('pantos.validatornode.restapi.get_blockchain_client')
-@unittest.mock.patch('pantos.validatornode.restapi.get_blockchain_config',
-                     return_value={'active': True})
+@unittest.mock.patch('pantos.validatornode.restapi.get_active_blockchains',
+                     return_value=tuple(Blockchain))
 def test_transfer_signature_conflict_signature_error(
-        mock_get_blockchain_config, mock_get_blockchain_client,
+        mock_get_active_blockchains, mock_get_blockchain_client,
         mock_signature_interactor, transfer_signature_request, test_client):
     mock_get_blockchain_client().is_valid_transaction_id.return_value = True
     mock_signature_interactor().add_secondary_node_signature.side_effect = \
@@ -130,9 +130,9 @@ def test_transfer_signature_conflict_signature_error(
     'ignore:The \'__version__\' attribute is deprecated')
 @unittest.mock.patch('pantos.validatornode.restapi.SignatureInteractor')
 @unittest.mock.patch('pantos.validatornode.restapi.get_blockchain_client')
-@unittest.mock.patch('pantos.validatornode.restapi.get_blockchain_config',
-                     return_value={'active': True})
-def test_transfer_signature_forbidden_signer_error(mock_get_blockchain_config,
+@unittest.mock.patch('pantos.validatornode.restapi.get_active_blockchains',
+                     return_value=tuple(Blockchain))
+def test_transfer_signature_forbidden_signer_error(mock_get_active_blockchains,
                                                    mock_get_blockchain_client,
                                                    mock_signature_interactor,
                                                    transfer_signature_request,
@@ -152,9 +152,9 @@ def test_transfer_signature_forbidden_signer_error(mock_get_blockchain_config,
     'ignore:The \'__version__\' attribute is deprecated')
 @unittest.mock.patch('pantos.validatornode.restapi.SignatureInteractor')
 @unittest.mock.patch('pantos.validatornode.restapi.get_blockchain_client')
-@unittest.mock.patch('pantos.validatornode.restapi.get_blockchain_config',
-                     return_value={'active': True})
-def test_transfer_signature_not_found_error(mock_get_blockchain_config,
+@unittest.mock.patch('pantos.validatornode.restapi.get_active_blockchains',
+                     return_value=tuple(Blockchain))
+def test_transfer_signature_not_found_error(mock_get_active_blockchains,
                                             mock_get_blockchain_client,
                                             mock_signature_interactor,
                                             transfer_signature_request,
@@ -174,9 +174,9 @@ def test_transfer_signature_not_found_error(mock_get_blockchain_config,
     'ignore:The \'__version__\' attribute is deprecated')
 @unittest.mock.patch('pantos.validatornode.restapi.SignatureInteractor')
 @unittest.mock.patch('pantos.validatornode.restapi.get_blockchain_client')
-@unittest.mock.patch('pantos.validatornode.restapi.get_blockchain_config',
-                     return_value={'active': True})
-def test_transfer_signature_internal_server_error(mock_get_blockchain_config,
+@unittest.mock.patch('pantos.validatornode.restapi.get_active_blockchains',
+                     return_value=tuple(Blockchain))
+def test_transfer_signature_internal_server_error(mock_get_active_blockchains,
                                                   mock_get_blockchain_client,
                                                   mock_signature_interactor,
                                                   transfer_signature_request,
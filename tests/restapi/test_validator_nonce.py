@@ -11,9 +11,9 @@ from pantos.validatornode.business.base import UnknownTransferError
     'ignore:The \'__version__\' attribute is deprecated')
 @unittest.mock.patch('pantos.validatornode.restapi.TransferInteractor')
 @unittest.mock.patch('pantos.validatornode.restapi.get_blockchain_client')
-@unittest.mock.patch('pantos.validatornode.restapi.get_blockchain_config',
-                     return_value={'active': True})
-def test_validator_nonce_correct(mock_get_blockchain_config,
+@unittest.mock.patch('pantos.validatornode.restapi.get_active_blockchains',
+                     return_value=tuple(Blockchain))
+def test_validator_nonce_correct(mock_get_active_blockchains,
                                  mock_get_blockchain_client,
                                  mock_transfer_interactor, source_blockchain,
                                  source_transaction_id, validator_nonce,
@@ -30,6 +30,51 @@ def test_validator_nonce_correct(mock_get_blockchain_config,
     assert json.loads(response.text)['validator_nonce'] == validator_nonce
 
 
+@pytest.mark.filterwarnings(
+    'ignore:The \'__version__\' attribute is deprecated')
+@unittest.mock.patch('pantos.validatornode.restapi.TransferInteractor')
+@unittest.mock.patch('pantos.validatornode.restapi.get_blockchain_client')
+@unittest.mock.patch('pantos.validatornode.restapi.get_active_blockchains',
+                     return_value=tuple(Blockchain))
+def test_validator_nonce_transaction_id_validation_cached(
+        mock_get_active_blockchains, mock_get_blockchain_client,
+        mock_transfer_interactor, source_blockchain, source_transaction_id,
+        validator_nonce, test_client):
+    mock_get_blockchain_client().is_valid_transaction_id.return_value = True
+    mock_transfer_interactor().get_validator_nonce.return_value = \
+        validator_nonce
+    request_url = _get_request_url(source_blockchain.value,
+                                   source_transaction_id)
+
+    first_response = test_client.get(request_url)
+    second_response = test_client.get(request_url)
+
+    assert first_response.status_code == 200
+    assert second_response.status_code == 200
+    mock_get_blockchain_client().is_valid_transaction_id.\
+        assert_called_once_with(source_transaction_id)
+
+
+@pytest.mark.filterwarnings(
+    'ignore:The \'__version__\' attribute is deprecated')
+@unittest.mock.patch('pantos.validatornode.restapi.get_blockchain_client')
+@unittest.mock.patch('pantos.validatornode.restapi.get_active_blockchains',
+                     return_value=tuple(Blockchain))
+def test_validator_nonce_invalid_transaction_id_not_cached(
+        mock_get_active_blockchains, mock_get_blockchain_client,
+        source_blockchain, test_client):
+    mock_get_blockchain_client().is_valid_transaction_id.return_value = False
+    request_url = _get_request_url(source_blockchain.value, 'some_string')
+
+    first_response = test_client.get(request_url)
+    second_response = test_client.get(request_url)
+
+    assert first_response.status_code == 400
+    assert second_response.status_code == 400
+    assert mock_get_blockchain_client().is_valid_transaction_id.call_count \
+        == 2
+
+
 @pytest.mark.filterwarnings(
     'ignore:The \'__version__\' attribute is deprecated')
 @pytest.mark.parametrize('source_transaction_id', [None, 'some_string'])
@@ -38,9 +83,9 @@ def test_validator_nonce_correct(mock_get_blockchain_config,
     [None, 'some_string', Blockchain.ETHEREUM.value,
      max(Blockchain) + 1])
 @unittest.mock.patch('pantos.validatornode.restapi.get_blockchain_client')
-@unittest.mock.patch('pantos.validatornode.restapi.get_blockchain_config',
-                     return_value={'active': True})
-def test_validator_nonce_bad_request_error(mock_get_blockchain_config,
+@unittest.mock.patch('pantos.validatornode.restapi.get_active_blockchains',
+                     return_value=tuple(Blockchain))
+def test_validator_nonce_bad_request_error(mock_get_active_blockchains,
                                            mock_get_blockchain_client,
                                            source_blockchain_id,
                                            source_transaction_id, test_client):
@@ -66,9 +111,9 @@ def test_validator_nonce_bad_request_error(mock_get_blockchain_config,
     'ignore:The \'__version__\' attribute is deprecated')
 @unittest.mock.patch('pantos.validatornode.restapi.TransferInteractor')
 @unittest.mock.patch('pantos.validatornode.restapi.get_blockchain_client')
-@unittest.mock.patch('pantos.validatornode.restapi.get_blockchain_config',
-                     return_value={'active': True})
-def test_validator_nonce_not_found_error(mock_get_blockchain_config,
+@unittest.mock.patch('pantos.validatornode.restapi.get_active_blockchains',
+                     return_value=tuple(Blockchain))
+def test_validator_nonce_not_found_error(mock_get_active_blockchains,
                                          mock_get_blockchain_client,
                                          mock_transfer_interactor,
                                          source_blockchain,
@@ -89,9 +134,9 @@ def test_validator_nonce_not_found_error(mock_get_blockchain_config,
     'ignore:The \'__version__\' attribute is deprecated')
 @unittest.mock.patch('pantos.validatornode.restapi.TransferInteractor')
 @unittest.mock.patch('pantos.validatornode.restapi.get_blockchain_client')
-@unittest.mock.patch('pantos.validatornode.restapi.get_blockchain_config',
-                     return_value={'active': True})
-def test_validator_nonce_internal_server_error(mock_get_blockchain_config,
+@unittest.mock.patch('pantos.validatornode.restapi.get_active_blockchains',
+                     return_value=tuple(Blockchain))
+def test_validator_nonce_internal_server_error(mock_get_active_blockchains,
                                                mock_get_blockchain_client,
                                                mock_transfer_interactor,
                                                source_blockchain,
@@ -8,6 +8,7 @@ from pantos.common.blockchains.enums import Blockchain
 from pantos.common.configuration import Config
 from pantos.common.configuration import ConfigError
 
+from pantos.validatornode.configuration import get_active_blockchains
 from pantos.validatornode.configuration import get_blockchain_config
 from pantos.validatornode.configuration import get_blockchains_rpc_nodes
 from pantos.validatornode.configuration import load_config
@@ -152,6 +153,28 @@ def test_load_config_error(removed_config_section):
                 load_config(file_path=config_file_path, reload=False)
 
 
+@pytest.mark.parametrize('inactive_blockchains',
+                         [[], [Blockchain.SOLANA, Blockchain.SONIC]])
+def test_get_active_blockchains_correct(inactive_blockchains, monkeypatch):
+    # Restore the cached active blockchains of the real configuration
+    monkeypatch.setattr(
+        'pantos.validatornode.configuration._active_blockchains', None)
+    mocked_config = Config('')
+    with unittest.mock.patch('pantos.validatornode.configuration.config',
+                             mocked_config):
+        with _prepare_config_file(_CONFIGURATION) as config_file_path:
+            load_config(file_path=config_file_path)
+        for blockchain in inactive_blockchains:
+            blockchain_name = blockchain.name.lower()
+            mocked_config['blockchains'][blockchain_name]['active'] = False
+        active_blockchains = get_active_blockchains()
+        mocked_config['blockchains']['ethereum']['active'] = False
+        assert active_blockchains == tuple(
+            blockchain for blockchain in Blockchain
+            if blockchain not in inactive_blockchains)
+        assert get_active_blockchains() == active_blockchains
+
+
 def test_get_blockchain_rpc_nodes_no_active_blockchains_correct():
     mocked_config = Config('')
     with unittest.mock.patch('pantos.validatornode.configuration.config',
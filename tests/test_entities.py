@@ -111,3 +111,34 @@ def test_cross_chain_transfer_from_dict_key_error(removed_dict_key,
                                   [removed_dict_key]]
     with pytest.raises(KeyError):
         CrossChainTransfer.from_dict(cross_chain_transfer_dict)
+
+
+@pytest.mark.parametrize('blockchain_id_key',
+                         ['source_blockchain_id', 'destination_blockchain_id'])
+def test_cross_chain_transfer_from_dict_unknown_blockchain_error(
+        blockchain_id_key, cross_chain_transfer_dict):
+    cross_chain_transfer_dict[blockchain_id_key] = max(Blockchain) + 1
+    with pytest.raises(ValueError):
+        CrossChainTransfer.from_dict(cross_chain_transfer_dict)
+
+
+def test_cross_chain_transfer_eventual_properties_follow_reversal(
+        cross_chain_transfer_dict):
+    cross_chain_transfer_dict['is_reversal_transfer'] = False
+    cross_chain_transfer = CrossChainTransfer.from_dict(
+        cross_chain_transfer_dict)
+    assert (cross_chain_transfer.eventual_destination_blockchain ==
+            _DESTINATION_BLOCKCHAIN)
+    assert cross_chain_transfer.eventual_recipient_address == \
+        _RECIPIENT_ADDRESS
+    assert (cross_chain_transfer.eventual_destination_token_address ==
+            _DESTINATION_TOKEN_ADDRESS)
+
+    cross_chain_transfer.is_reversal_transfer = True
+
+    assert (cross_chain_transfer.eventual_destination_blockchain ==
+            _SOURCE_BLOCKCHAIN)
+    assert cross_chain_transfer.eventual_recipient_address == \
+        _SENDER_ADDRESS
+    assert (cross_chain_transfer.eventual_destination_token_address ==
+            _SOURCE_TOKEN_ADDRESS)
@@ -5,6 +5,7 @@ import pytest
 from pantos.common.blockchains.enums import Blockchain
 
 from pantos.validatornode.business.transfers import TransferInteractor
+from pantos.validatornode.monitor import _RESTART_DELAY
 from pantos.validatornode.monitor import run_monitor
 
 _INACTIVE_BLOCKCHAINS = [Blockchain.SONIC, Blockchain.SOLANA]
@@ -14,12 +15,13 @@ _INTERVAL = 10
 _NUMBER_THREADS = 4
 
 
-class _Break(Exception):
+class _Break(BaseException):
     pass
 
 
 class _MockThread:
-    def __init__(self, target):
+    def __init__(self, target, daemon):
+        assert daemon
         self.__target = target
 
     def start(self):
@@ -54,15 +56,16 @@ def _mock_as_completed(dictionary):
     return dictionary.keys()
 
 
-def _mock_get_blockchain_config(blockchain):
-    return {'active': blockchain not in _INACTIVE_BLOCKCHAINS}
+def _mock_get_active_blockchains():
+    return tuple(blockchain for blockchain in Blockchain
+                 if blockchain not in _INACTIVE_BLOCKCHAINS)
 
 
 @pytest.mark.parametrize('detect_new_transfers_error', [True, False])
 @unittest.mock.patch.object(TransferInteractor, 'detect_new_transfers')
 @unittest.mock.patch('time.sleep', side_effect=_Break)
-@unittest.mock.patch('pantos.validatornode.monitor.get_blockchain_config',
-                     _mock_get_blockchain_config)
+@unittest.mock.patch('pantos.validatornode.monitor.get_active_blockchains',
+                     _mock_get_active_blockchains)
 @unittest.mock.patch(
     'pantos.validatornode.monitor.config',
     {'monitor': {
@@ -86,3 +89,15 @@ def test_run_monitor(mock_time_sleep, mock_detect_new_transfers,
         unittest.mock.call(blockchain)
         for blockchain in Blockchain if blockchain not in _INACTIVE_BLOCKCHAINS
     ], any_order=True)
+
+
+@unittest.mock.patch('pantos.validatornode.monitor._run_monitor_workers',
+                     side_effect=[Exception, _Break])
+@unittest.mock.patch('time.sleep')
+@unittest.mock.patch('threading.Thread', _MockThread)
+def test_run_monitor_restarted_after_error(mock_time_sleep,
+                                           mock_run_monitor_workers):
+    with pytest.raises(_Break):
+        run_monitor()
+    assert mock_run_monitor_workers.call_count == 2
+    mock_time_sleep.assert_called_once_with(_RESTART_DELAY)
@@ -1,3 +1,4 @@
+import json
 import unittest.mock
 
 import pytest
@@ -60,9 +61,9 @@ def test_init_correct(with_trailing_slash):
 def test_get_validator_nonce_correct(mock_requests_get, primary_node_client,
                                      validator_nonce_get_request):
     mock_requests_get().status_code = requests.codes.ok
-    mock_requests_get().json.return_value = {
+    mock_requests_get().content = json.dumps({
         'validator_nonce': _VALIDATOR_NONCE
-    }
+    }).encode()
     mock_requests_get.call_count = 0
 
     validator_nonce = primary_node_client.get_validator_nonce(
@@ -91,15 +92,14 @@ def test_get_validator_nonce_send_error(mock_requests_get, send_error,
 def test_get_validator_nonce_decode_error(mock_requests_get,
                                           primary_node_client,
                                           validator_nonce_get_request):
-    mock_requests_get().json.side_effect = requests.JSONDecodeError('', '', 0)
+    mock_requests_get().content = b'no JSON'
     mock_requests_get.call_count = 0
 
     with pytest.raises(PrimaryNodeClientError) as exception_info:
         primary_node_client.get_validator_nonce(validator_nonce_get_request)
 
     _assert_requests_get_call_correct(mock_requests_get, primary_node_client)
-    assert isinstance(exception_info.value.__context__,
-                      requests.JSONDecodeError)
+    assert isinstance(exception_info.value.__context__, json.JSONDecodeError)
 
 
 @pytest.mark.parametrize(
@@ -115,7 +115,9 @@ def test_get_validator_nonce_primary_node_error(mock_requests_get,
                                                 primary_node_client,
                                                 validator_nonce_get_request):
     mock_requests_get().status_code = primary_node_error[0]
-    mock_requests_get().json.return_value = {'message': primary_node_error[1]}
+    mock_requests_get().content = json.dumps({
+        'message': primary_node_error[1]
+    }).encode()
     mock_requests_get.call_count = 0
 
     with pytest.raises(primary_node_error[2]) as exception_info:
@@ -160,7 +162,7 @@ def test_post_transfer_signature_send_error(mock_requests_post, send_error,
 def test_post_transfer_signature_decode_error(mock_requests_post,
                                               primary_node_client,
                                               transfer_signature_post_request):
-    mock_requests_post().json.side_effect = requests.JSONDecodeError('', '', 0)
+    mock_requests_post().content = b'no JSON'
     mock_requests_post.call_count = 0
 
     with pytest.raises(PrimaryNodeClientError) as exception_info:
@@ -168,8 +170,7 @@ def test_post_transfer_signature_decode_error(mock_requests_post,
             transfer_signature_post_request)
 
     _assert_requests_post_call_correct(mock_requests_post, primary_node_client)
-    assert isinstance(exception_info.value.__context__,
-                      requests.JSONDecodeError)
+    assert isinstance(exception_info.value.__context__, json.JSONDecodeError)
 
 
 @pytest.mark.parametrize(
@@ -190,7 +191,9 @@ def test_post_transfer_signature_primary_node_error(
         mock_requests_post, primary_node_error, primary_node_client,
         transfer_signature_post_request):
     mock_requests_post().status_code = primary_node_error[0]
-    mock_requests_post().json.return_value = {'message': primary_node_error[1]}
+    mock_requests_post().content = json.dumps({
+        'message': primary_node_error[1]
+    }).encode()
     mock_requests_post.call_count = 0
 
     with pytest.raises(primary_node_error[2]) as exception_info: